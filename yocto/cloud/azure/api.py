@@ -7,13 +7,24 @@ Azure CLI wrapper and deployment functions.
 import json
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from threading import BoundedSemaphore
 
 from yocto.cloud.azure.defaults import (
+    AZ_CLI_ENV,
+    AZCOPY_BLOCK_SIZE_MB,
+    AZCOPY_BUFFER_GB,
+    AZCOPY_CONCURRENCY_VALUE,
     CONSENSUS_PORT,
+    DISK_POLL_INTERVAL,
+    DISK_PROVISION_TIMEOUT,
+    MAX_PARALLEL_DISK_COPIES,
+    OS_DISK_SKU,
 )
 from yocto.cloud.cloud_api import CloudApi
 from yocto.cloud.cloud_config import CloudProvider
@@ -22,39 +33,116 @@ from yocto.config import DeployConfigs, VmConfigs
 
 logger = logging.getLogger(__name__)
 
+# Marker recording the last successful check_dependencies run
+DEPS_CACHE_FILE = Path.home() / ".cache" / "yocto" / "deps_ok"
+
+# (name, priority, port, protocol, source, description)
+NsgRule = tuple[str, str, str, str, str, str]
+
 
 # Disk Operations
 class AzureApi(CloudApi):
     """Azure implementation of CloudApi."""
 
+    _deps_checked: bool = False
+    _existing_resource_groups: set[str] = set()
+    # resource group -> {public IP name: address}
+    _public_ips: dict[str, dict[str, str]] = {}
+
     @classmethod
     def get_cloud_provider(cls) -> CloudProvider:
         """Return the CloudProvider enum for this API."""
         return CloudProvider.AZURE
 
     @staticmethod
-    def check_dependencies():
-        """Check if required tools are installed."""
-        tools = ["az", "azcopy"]
+    def run_command(
+        cmd: list[str],
+        show_logs: bool = False,
+        env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Execute a command with AZ_CLI_ENV applied.
+
+        Variables in `env` (or the inherited environment) take precedence.
+        """
+        base_env = os.environ if env is None else env
+        return CloudApi.run_command(
+            cmd, show_logs=show_logs, env={**AZ_CLI_ENV, **base_env}
+        )
+
+    @staticmethod
+    def _check_tool(tool: str) -> None:
+        try:
+            subprocess.run(
+                [tool, "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            raise RuntimeError(
+                f"Error: '{tool}' command not found. Please install {tool}."
+            ) from e
+
+    @staticmethod
+    def _dependencies_key(tools: list[str]) -> str | None:
+        """Identify the installed tools by path and modification time.
+
+        Returns None if any tool is missing from PATH.
+        """
+        lines = []
         for tool in tools:
-            try:
-                subprocess.run(
-                    [tool, "--version"], capture_output=True, check=True
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                raise RuntimeError(
-                    f"Error: '{tool}' command not found. Please install {tool}."
-                ) from e
+            path = shutil.which(tool)
+            if path is None:
+                return None
+            lines.append(f"{path}:{os.path.getmtime(path)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def check_dependencies(force: bool = False):
+        """Check if required tools are installed.
+
+        `az --version` alone takes several seconds, so a successful check
+        is recorded in DEPS_CACHE_FILE and skipped until one of the tools
+        is reinstalled or `force` is set. Within a process the check runs
+        at most once.
+        """
+        if AzureApi._deps_checked and not force:
+            return
+
+        tools = ["az", "azcopy"]
+        key = AzureApi._dependencies_key(tools)
+        if (
+            not force
+            and key is not None
+            and DEPS_CACHE_FILE.exists()
+            and DEPS_CACHE_FILE.read_text() == key
+        ):
+            AzureApi._deps_checked = True
+            return
+
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            list(executor.map(AzureApi._check_tool, tools))
+
+        if key is not None:
+            DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            DEPS_CACHE_FILE.write_text(key)
+        AzureApi._deps_checked = True
 
     @classmethod
     def resource_group_exists(cls, name: str) -> bool:
-        """Check if resource group exists."""
-        try:
-            cmd = ["az", "group", "show", "--name", name]
-            cls.run_command(cmd)
+        """Check if resource group exists.
+
+        Only positive answers are cached: a group that exists is not
+        expected to disappear mid-deploy, but a missing one may be created.
+        """
+        if name in cls._existing_resource_groups:
             return True
-        except subprocess.CalledProcessError:
-            return False
+        cmd = ["az", "group", "exists", "--name", name]
+        result = cls.run_command(cmd)
+        exists = result.stdout.strip() == "true"
+        if exists:
+            cls._existing_resource_groups.add(name)
+        return exists
 
     @classmethod
     def create_resource_group(cls, name: str, location: str) -> None:
@@ -62,6 +150,7 @@ class AzureApi(CloudApi):
         logger.info(f"Creating resource group: {name} in {location}")
         cmd = ["az", "group", "create", "--name", name, "--location", location]
         cls.run_command(cmd)
+        cls._existing_resource_groups.add(name)
 
     @classmethod
     def ensure_created_resource_group(cls, name: str, location: str):
@@ -106,7 +195,41 @@ class AzureApi(CloudApi):
             "tsv",
         ]
         result = cls.run_command(cmd)
-        return result.stdout.strip()
+        ip_address = result.stdout.strip()
+        if resource_group in cls._public_ips:
+            cls._public_ips[resource_group][name] = ip_address
+        return ip_address
+
+    @classmethod
+    def get_existing_public_ips(cls, resource_group: str) -> dict[str, str]:
+        """Map the name of every public IP in a resource group to its address.
+
+        The listing is fetched once per resource group and then reused, so
+        multi-node deploys resolve all their IPs with a single call.
+        """
+        if resource_group in cls._public_ips:
+            return cls._public_ips[resource_group]
+
+        cmd = [
+            "az",
+            "network",
+            "public-ip",
+            "list",
+            "--resource-group",
+            resource_group,
+            "--query",
+            "[].{name: name, ip: ipAddress}",
+            "-o",
+            "json",
+        ]
+        result = cls.run_command(cmd)
+        ips = {
+            entry["name"]: entry["ip"]
+            for entry in json.loads(result.stdout)
+            if entry["ip"]
+        }
+        cls._public_ips[resource_group] = ips
+        return ips
 
     @classmethod
     def get_existing_public_ip(
@@ -116,23 +239,7 @@ class AzureApi(CloudApi):
     ) -> str | None:
         """Get existing IP address if it exists."""
         try:
-            cmd = [
-                "az",
-                "network",
-                "public-ip",
-                "show",
-                "--name",
-                name,
-                "--resource-group",
-                resource_group,
-                "--query",
-                "ipAddress",
-                "-o",
-                "tsv",
-            ]
-            result = cls.run_command(cmd)
-            ip = result.stdout.strip()
-            return ip if ip and ip != "None" else None
+            return cls.get_existing_public_ips(resource_group).get(name)
         except subprocess.CalledProcessError:
             return None
 
@@ -145,19 +252,23 @@ class AzureApi(CloudApi):
             "dns",
             "record-set",
             "a",
-            "list",
+            "show",
             "--resource-group",
             config.domain.resource_group,
             "--zone-name",
             config.domain.name,
-            "--recordsetnamesuffix",
+            "--name",
             config.domain.record,
             "--query",
-            "[].ARecords[].ipv4Address",
+            "ARecords[].ipv4Address",
             "-o",
             "tsv",
         ]
-        result = cls.run_command(cmd)
+        try:
+            result = cls.run_command(cmd)
+        except subprocess.CalledProcessError:
+            # No record set yet
+            return []
         return (
             result.stdout.strip().split("\n") if result.stdout.strip() else []
         )
@@ -220,14 +331,47 @@ class AzureApi(CloudApi):
         ip_address: str,
         remove_old: bool = True,
     ) -> None:
-        """Update DNS A record with new IP address."""
+        """Update DNS A record with new IP address.
+
+        With remove_old, the record set is replaced in a single PUT so it
+        never goes through an empty state; otherwise the IP is appended.
+        """
         if remove_old:
-            previous_ips = cls.get_existing_dns_ips(config)
-            for prev_ip in previous_ips:
-                if prev_ip:
-                    cls.remove_dns_ip(config, prev_ip)
+            cls.replace_dns_ips(config, [ip_address])
+        else:
+            cls.add_dns_ip(config, ip_address)
 
-        cls.add_dns_ip(config, ip_address)
+    @classmethod
+    def replace_dns_ips(
+        cls, config: DeployConfigs, ip_addresses: list[str]
+    ) -> None:
+        """Atomically set the DNS A record to exactly these IPs."""
+        domain = f"{config.domain.record}.{config.domain.name}"
+        logger.info(f"Mapping {domain} to {', '.join(ip_addresses)}")
+        # az rest substitutes {subscriptionId} with the active subscription
+        uri = (
+            "/subscriptions/{subscriptionId}"
+            f"/resourceGroups/{config.domain.resource_group}"
+            f"/providers/Microsoft.Network/dnsZones/{config.domain.name}"
+            f"/A/{config.domain.record}?api-version=2018-05-01"
+        )
+        body = {
+            "properties": {
+                "TTL": 300,
+                "ARecords": [{"ipv4Address": ip} for ip in ip_addresses],
+            }
+        }
+        cmd = [
+            "az",
+            "rest",
+            "--method",
+            "put",
+            "--uri",
+            uri,
+            "--body",
+            json.dumps(body),
+        ]
+        cls.run_command(cmd)
 
     @classmethod
     def get_disk_name(cls, config: DeployConfigs, image_path: Path) -> str:
@@ -238,19 +382,28 @@ class AzureApi(CloudApi):
         """
         return cls.get_raw_disk_name(config.vm.name, image_path.name)
 
+    @staticmethod
+    def _disk_args(config: DeployConfigs, disk_name: str) -> list[str]:
+        """Name and resource group arguments for `az disk` commands."""
+        return ["-n", disk_name, "-g", config.vm.resource_group]
+
     @classmethod
     def disk_exists(cls, config: DeployConfigs, image_path: Path) -> bool:
-        disk_name = cls.get_disk_name(config, image_path)
         cmd = [
             "az",
             "disk",
-            "list",
-            "-g",
-            config.vm.resource_group,
+            "show",
+            *cls._disk_args(config, cls.get_disk_name(config, image_path)),
+            "--query",
+            "name",
+            "-o",
+            "tsv",
         ]
-        result = cls.run_command(cmd, show_logs=False)
-        disks = json.loads(result.stdout)
-        return any(disk_name == d["name"] for d in disks)
+        try:
+            cls.run_command(cmd, show_logs=False)
+            return True
+        except subprocess.CalledProcessError:
+            return False
 
     @classmethod
     def create_disk(cls, config: DeployConfigs, image_path: Path) -> str:
@@ -267,10 +420,7 @@ class AzureApi(CloudApi):
             "az",
             "disk",
             "create",
-            "-n",
-            disk_name,
-            "-g",
-            config.vm.resource_group,
+            *cls._disk_args(config, disk_name),
             "-l",
             config.vm.location,
             "--os-type",
@@ -280,37 +430,69 @@ class AzureApi(CloudApi):
             "--upload-size-bytes",
             str(disk_size),
             "--sku",
-            "standard_lrs",
+            OS_DISK_SKU,
             "--security-type",
             "ConfidentialVM_NonPersistedTPM",
             "--hyper-v-generation",
             "V2",
+            # upload_disk polls for provisioning itself, much more often
+            # than the CLI's long-running-operation poller does
+            "--no-wait",
         ]
         cls.run_command(cmd, show_logs=config.show_logs)
         return disk_name
 
     @classmethod
-    def _grant_disk_access(cls, config: DeployConfigs, image_path: Path) -> str:
+    def _wait_for_disk(cls, config: DeployConfigs, disk_name: str) -> None:
+        """Block until the disk has finished provisioning."""
+        cmd = [
+            "az",
+            "disk",
+            "show",
+            *cls._disk_args(config, disk_name),
+            "--query",
+            "provisioningState",
+            "-o",
+            "tsv",
+        ]
+        deadline = time.monotonic() + DISK_PROVISION_TIMEOUT
+        while True:
+            try:
+                state = cls.run_command(cmd).stdout.strip()
+            except subprocess.CalledProcessError:
+                # Not visible yet right after a --no-wait create
+                state = None
+            if state == "Succeeded":
+                return
+            if state == "Failed":
+                raise RuntimeError(f"Provisioning disk {disk_name} failed")
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Disk {disk_name} not provisioned after "
+                    f"{DISK_PROVISION_TIMEOUT}s (state: {state})"
+                )
+            time.sleep(DISK_POLL_INTERVAL)
+
+    @classmethod
+    def _grant_disk_access(cls, config: DeployConfigs, disk_name: str) -> str:
         # Grant access
         logger.info("Granting access")
         cmd = [
             "az",
             "disk",
             "grant-access",
-            "-n",
-            cls.get_disk_name(config, image_path),
-            "-g",
-            config.vm.resource_group,
+            *cls._disk_args(config, disk_name),
             "--access-level",
             "Write",
             "--duration-in-seconds",
             "86400",
+            "--query",
+            "accessSas",
             "-o",
-            "json",
+            "tsv",
         ]
         result = cls.run_command(cmd, show_logs=False)
-        sas_data = json.loads(result.stdout)
-        return sas_data["accessSas"]
+        return result.stdout.strip()
 
     @classmethod
     def delete_disk(
@@ -338,40 +520,74 @@ class AzureApi(CloudApi):
         cls.run_command(cmd, show_logs=True)
 
     @classmethod
-    def _copy_disk(
-        cls,
-        image_path: Path,
-        sas_uri: str,
-        show_logs: bool = False,
-    ) -> None:
+    def _copy_disk(cls, image_path: Path, sas_uri: str) -> None:
         # Copy disk
         logger.info("Copying disk")
-        cmd = ["azcopy", "copy", image_path, sas_uri, "--blob-type", "PageBlob"]
-        cls.run_command(cmd, show_logs=show_logs)
+        cmd = [
+            "azcopy",
+            "copy",
+            str(image_path),
+            sas_uri,
+            "--blob-type",
+            "PageBlob",
+            "--block-size-mb",
+            AZCOPY_BLOCK_SIZE_MB,
+            "--log-level",
+            "ERROR",
+            "--check-length=false",
+        ]
+        # Explicitly exported AZCOPY_* values take precedence
+        env = {
+            "AZCOPY_CONCURRENCY_VALUE": AZCOPY_CONCURRENCY_VALUE,
+            "AZCOPY_BUFFER_GB": AZCOPY_BUFFER_GB,
+            **os.environ,
+        }
+        # The upload dominates deploy time, so always show its progress
+        cls.run_command(cmd, show_logs=True, env=env)
 
     @classmethod
-    def _revoke_disk_access(
-        cls, config: DeployConfigs, image_path: Path
-    ) -> None:
+    def _revoke_disk_access(cls, config: DeployConfigs, disk_name: str) -> None:
         # Revoke access
         logger.info("Revoking access")
         cmd = [
             "az",
             "disk",
             "revoke-access",
-            "-n",
-            cls.get_disk_name(config, image_path),
-            "-g",
-            config.vm.resource_group,
+            *cls._disk_args(config, disk_name),
         ]
         cls.run_command(cmd, show_logs=config.show_logs)
 
     @classmethod
     def upload_disk(cls, config: DeployConfigs, image_path: Path) -> None:
         """Upload disk image to Azure."""
-        sas_uri = cls._grant_disk_access(config, image_path)
-        cls._copy_disk(image_path, sas_uri, show_logs=config.show_logs)
-        cls._revoke_disk_access(config, image_path)
+        cls.upload_disks([(config, image_path)])
+
+    @classmethod
+    def upload_disks(cls, uploads: list[tuple[DeployConfigs, Path]]) -> None:
+        """Upload several disk images, overlapping their control-plane calls.
+
+        Every disk is granted access as soon as it is provisioned, but at
+        most MAX_PARALLEL_DISK_COPIES azcopy processes run at once since
+        each one is already multi-threaded. A disk's access is revoked as
+        soon as its own copy finishes.
+        """
+        copy_slots = BoundedSemaphore(MAX_PARALLEL_DISK_COPIES)
+
+        def upload(config: DeployConfigs, image_path: Path) -> None:
+            disk_name = cls.get_disk_name(config, image_path)
+            cls._wait_for_disk(config, disk_name)
+            sas_uri = cls._grant_disk_access(config, disk_name)
+            with copy_slots:
+                cls._copy_disk(image_path, sas_uri)
+            cls._revoke_disk_access(config, disk_name)
+
+        with ThreadPoolExecutor(max_workers=max(len(uploads), 1)) as executor:
+            futures = [
+                executor.submit(upload, config, image_path)
+                for config, image_path in uploads
+            ]
+            for future in as_completed(futures):
+                future.result()
 
     @classmethod
     def create_nsg(cls, config: DeployConfigs) -> None:
@@ -464,9 +680,83 @@ class AzureApi(CloudApi):
             ),
         ]
 
-        for name, priority, port, protocol, source, description in rules:
+        cls._deploy_nsg_rules(config, rules)
+
+    @staticmethod
+    def _nsg_template(
+        config: DeployConfigs,
+        rules: list[NsgRule],
+    ) -> dict:
+        """Build an ARM template declaring the NSG with all its rules."""
+        security_rules = [
+            {
+                "name": name,
+                "properties": {
+                    "description": description,
+                    "priority": int(priority),
+                    "protocol": protocol,
+                    "access": "Allow",
+                    "direction": "Inbound",
+                    "sourceAddressPrefix": source,
+                    "sourcePortRange": "*",
+                    "destinationAddressPrefix": "*",
+                    "destinationPortRange": port,
+                },
+            }
+            for name, priority, port, protocol, source, description in rules
+        ]
+        return {
+            "$schema": (
+                "https://schema.management.azure.com/schemas/"
+                "2019-04-01/deploymentTemplate.json#"
+            ),
+            "contentVersion": "1.0.0.0",
+            "resources": [
+                {
+                    "type": "Microsoft.Network/networkSecurityGroups",
+                    "apiVersion": "2023-09-01",
+                    "name": config.vm.nsg_name,
+                    "location": config.vm.location,
+                    "properties": {"securityRules": security_rules},
+                }
+            ],
+        }
+
+    @classmethod
+    def _deploy_nsg_rules(
+        cls,
+        config: DeployConfigs,
+        rules: list[NsgRule],
+    ) -> None:
+        """Apply all NSG rules with a single ARM deployment.
+
+        Each `az network nsg rule create` pays the full az startup cost,
+        so the rules are submitted together as one template instead.
+        """
+        for *_, description in rules:
             logger.info(f"Creating {description}")
-            cls.add_nsg_rule(config, name, priority, port, protocol, source)
+
+        template = cls._nsg_template(config, rules)
+        fd, template_file = tempfile.mkstemp(suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(template, f)
+
+            cmd = [
+                "az",
+                "deployment",
+                "group",
+                "create",
+                "--resource-group",
+                config.vm.resource_group,
+                "--name",
+                f"{config.vm.nsg_name}-nsg-rules",
+                "--template-file",
+                template_file,
+            ]
+            cls.run_command(cmd, show_logs=config.show_logs)
+        finally:
+            os.unlink(template_file)
 
     @classmethod
     def create_data_disk(
@@ -538,21 +828,19 @@ class AzureApi(CloudApi):
     @classmethod
     def create_user_data_file(cls, config: DeployConfigs) -> str:
         """Create temporary user data file."""
+        contents = cls.render_user_data(config)
         fd, temp_file = tempfile.mkstemp(suffix=".yaml")
         try:
-            with os.fdopen(fd, "w") as f:
-                f.write(f'CERTBOT_EMAIL="{config.email}"\n')
-                f.write(f'RECORD_NAME="{config.domain.record}"\n')
-                f.write(f'DOMAIN="{config.domain.name}"\n')
-
-            logger.info(f"Created temporary user-data file: {temp_file}")
-            with open(temp_file) as f:
-                logger.info(f.read())
-
-            return temp_file
-        except:
-            os.close(fd)
+            os.write(fd, contents.encode())
+        except BaseException:
+            os.unlink(temp_file)
             raise
+        finally:
+            os.close(fd)
+
+        logger.info(f"Created temporary user-data file: {temp_file}")
+        logger.info(contents)
+        return temp_file
 
     @classmethod
     def create_vm_simple(
@@ -653,64 +941,80 @@ class AzureApi(CloudApi):
     def get_vm_ip(cls, vm_name: str, resource_group: str, location: str) -> str:
         """Get the public IP address of a VM with retry logic.
 
-        Azure may take a few moments after VM creation to populate IP info.
+        Azure may take a few moments after VM creation to populate IP info,
+        so retry with exponential backoff.
         """
         max_retries = 10
-        retry_delay = 3  # seconds
+        retry_delay = 1  # seconds, doubled after each attempt
+        max_retry_delay = 8  # seconds
 
+        cmd = [
+            "az",
+            "vm",
+            "list-ip-addresses",
+            "--resource-group",
+            resource_group,
+            "--name",
+            vm_name,
+            "--query",
+            "[0].virtualMachine.network.publicIpAddresses[0].ipAddress",
+            "-o",
+            "tsv",
+        ]
         for attempt in range(max_retries):
-            result = subprocess.run(
-                ["az", "vm", "list-ip-addresses", "--name", vm_name],
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode != 0:
+            try:
+                result = cls.run_command(cmd)
+            except subprocess.CalledProcessError as e:
                 raise RuntimeError(
-                    f"Failed to get IP address: {result.stderr.strip()}"
-                )
+                    f"Failed to get IP address: {e.stderr.strip()}"
+                ) from e
 
-            # Parse and return the IP address
-            vm_info = json.loads(result.stdout)
-
-            # Check if we got valid VM info
-            if not vm_info:
-                if attempt < max_retries - 1:
-                    msg = (
-                        f"VM info not available yet, "
-                        f"retrying in {retry_delay}s... "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    logger.warning(msg)
-                    time.sleep(retry_delay)
-                    continue
+            ip = result.stdout.strip()
+            if ip:
+                return ip
+
+            if attempt < max_retries - 1:
                 msg = (
-                    f"Failed to get VM info for {vm_name} "
-                    f"after {max_retries} attempts"
+                    f"IP address not available yet, "
+                    f"retrying in {retry_delay}s... "
+                    f"(attempt {attempt + 1}/{max_retries})"
                 )
-                raise RuntimeError(msg)
+                logger.warning(msg)
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, max_retry_delay)
 
-            # Check if IP address is available
-            try:
-                return vm_info[0]["virtualMachine"]["network"][
-                    "publicIpAddresses"
-                ][0]["ipAddress"]
-            except (KeyError, IndexError) as e:
-                if attempt < max_retries - 1:
-                    msg = (
-                        f"IP address not available yet, "
-                        f"retrying in {retry_delay}s... "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    logger.warning(msg)
-                    time.sleep(retry_delay)
-                    continue
-                raise RuntimeError(
-                    f"Failed to get IP address for {vm_name} after "
-                    f"{max_retries} attempts: {e}"
-                ) from e
+        raise RuntimeError(
+            f"Failed to get IP address for {vm_name} "
+            f"after {max_retries} attempts"
+        )
 
-        raise RuntimeError(f"Failed to get IP address for {vm_name}")
+    @classmethod
+    def _get_vm_nic_ids(cls, vm_name: str, resource_group: str) -> list[str]:
+        """Get the resource IDs of a VM's network interfaces."""
+        cmd = [
+            "az",
+            "vm",
+            "show",
+            "-g",
+            resource_group,
+            "--name",
+            vm_name,
+            "--query",
+            "networkProfile.networkInterfaces[].id",
+            "-o",
+            "tsv",
+        ]
+        try:
+            result = cls.run_command(cmd)
+        except subprocess.CalledProcessError:
+            return []
+        return result.stdout.split()
+
+    @classmethod
+    def _delete_nics(cls, nic_ids: list[str]) -> None:
+        """Delete network interfaces by resource ID."""
+        cmd = ["az", "network", "nic", "delete", "--ids", *nic_ids]
+        cls.run_command(cmd)
 
     @classmethod
     def delete_vm(
@@ -745,6 +1049,10 @@ class AzureApi(CloudApi):
         if not confirm(prompt):
             return False
 
+        # Look up the NICs first: they outlive the VM and have to be
+        # deleted separately once it is gone
+        nic_ids = cls._get_vm_nic_ids(vm_name, vm_resource_group)
+
         logger.info(
             f"Deleting VM {vm_name} in resource group {vm_resource_group}. "
             "This takes a few minutes..."
@@ -760,24 +1068,32 @@ class AzureApi(CloudApi):
             vm_name,
             "--yes",
         ]
-        process = subprocess.Popen(
-            args=" ".join(cmd),
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        stdout, stderr = process.communicate()
-
-        if process.returncode != 0:
-            logger.error(f"Error when deleting VM:\n{stderr.strip()}")
+        try:
+            result = cls.run_command(cmd)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Error when deleting VM:\n{e.stderr.strip()}")
             return False
 
-        logger.info(f"Successfully deleted {vm_name}:\n{stdout}")
-        logger.info("Deleting associated disk...")
+        logger.info(f"Successfully deleted {vm_name}:\n{result.stdout}")
+        logger.info("Deleting associated disk and network interfaces...")
 
+        # The disk and NICs are independent once the VM is gone. The public
+        # IP is kept: genesis nodes reuse it across deployments.
         region = meta["vm"]["region"]
-        cls.delete_disk(vm_resource_group, vm_name, artifact, region)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    cls.delete_disk,
+                    vm_resource_group,
+                    vm_name,
+                    artifact,
+                    region,
+                )
+            ]
+            if nic_ids:
+                futures.append(executor.submit(cls._delete_nics, nic_ids))
+            for future in as_completed(futures):
+                future.result()
         remove_vm_from_metadata(vm_name, home, cls.get_cloud_provider().value)
         return True
 
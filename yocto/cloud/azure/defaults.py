@@ -19,16 +19,45 @@ DEFAULT_REGION = "eastus"
 # Also works: Standard_EC4es_v6
 DEFAULT_VM_SIZE = "Standard_DC4es_v6"
 
+# SKU of the uploaded OS disk, matching the data disks. Premium SSD takes
+# page blob writes (and so the VHD upload) much faster than standard HDD.
+OS_DISK_SKU = "Premium_LRS"
+
 # Network ports
 CONSENSUS_PORT = 18551
 
-# Valid Azure regions
-VALID_REGIONS = {
-    "eastus",
-    "westus3",
-    "westeurope",
+# Environment for every az invocation: skip telemetry and warning output,
+# which az otherwise loads and formats on each (cold) start
+AZ_CLI_ENV = {
+    "AZURE_CORE_COLLECT_TELEMETRY": "no",
+    "AZURE_CORE_ONLY_SHOW_ERRORS": "true",
+    "AZURE_CORE_OUTPUT": "json",
+    "AZURE_CORE_DISABLE_PROGRESS_BAR": "true",
 }
 
+# azcopy tuning for multi-GB page blob (VHD) uploads
+AZCOPY_CONCURRENCY_VALUE = "64"
+AZCOPY_BUFFER_GB = "4"
+# Page blob uploads cap the block size at 4 MiB
+AZCOPY_BLOCK_SIZE_MB = "4"
+# Concurrent azcopy processes when uploading several disks
+MAX_PARALLEL_DISK_COPIES = 2
+
+# Polling for disks created with --no-wait (seconds)
+DISK_POLL_INTERVAL = 2
+DISK_PROVISION_TIMEOUT = 300
+
+# Valid Azure regions
+VALID_REGIONS = frozenset(
+    {
+        "eastus",
+        "westus3",
+        "westeurope",
+    }
+)
+# Sorted, comma-separated list for help and error messages
+VALID_REGIONS_STR = ", ".join(sorted(VALID_REGIONS))
+
 
 def validate_region(region: str) -> None:
     """Validate that the region is a valid Azure region.
@@ -40,9 +69,8 @@ def validate_region(region: str) -> None:
         ValueError: If the region is not valid
     """
     if region not in VALID_REGIONS:
-        valid_regions = ", ".join(sorted(VALID_REGIONS))
         msg = (
             f"Invalid Azure region: {region}. "
-            f"Valid Azure regions are: {valid_regions}"
+            f"Valid Azure regions are: {VALID_REGIONS_STR}"
         )
         raise ValueError(msg)
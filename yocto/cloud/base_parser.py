@@ -24,7 +24,7 @@ from yocto.cloud.azure.defaults import (
     DEFAULT_VM_SIZE as AZURE_VM_SIZE,
 )
 from yocto.cloud.azure.defaults import (
-    VALID_REGIONS as AZURE_REGIONS,
+    VALID_REGIONS_STR as AZURE_REGIONS_STR,
 )
 from yocto.cloud.gcp.defaults import (
     DEFAULT_PROJECT as GCP_PROJECT,
@@ -36,7 +36,7 @@ from yocto.cloud.gcp.defaults import (
     DEFAULT_ZONE as GCP_ZONE,
 )
 from yocto.cloud.gcp.defaults import (
-    VALID_ZONES as GCP_ZONES,
+    VALID_ZONES_STR as GCP_ZONES_STR,
 )
 
 
@@ -70,8 +70,8 @@ def create_base_parser(description: str) -> argparse.ArgumentParser:
     # (defaults applied in config based on --cloud)
     region_help = (
         "Cloud region/zone. Defaults based on --cloud:\n"
-        f"  Azure: {AZURE_REGION} (valid: {', '.join(sorted(AZURE_REGIONS))})\n"
-        f"  GCP: {GCP_ZONE} (valid: {', '.join(sorted(GCP_ZONES))})"
+        f"  Azure: {AZURE_REGION} (valid: {AZURE_REGIONS_STR})\n"
+        f"  GCP: {GCP_ZONE} (valid: {GCP_ZONES_STR})"
     )
     parser.add_argument(
         "-r",
@@ -153,6 +153,12 @@ def create_base_parser(description: str) -> argparse.ArgumentParser:
         type=str,
         help="Source IP address for SSH access. Defaults to this machine's IP",
     )
+    parser.add_argument(
+        "--refresh-source-ip",
+        action="store_true",
+        default=False,
+        help="Look up this machine's IP again instead of using the cache",
+    )
 
     # Logging
     parser.add_argument(
@@ -163,6 +169,14 @@ def create_base_parser(description: str) -> argparse.ArgumentParser:
         default=False,
     )
 
+    # Dependency checks
+    parser.add_argument(
+        "--force-check-deps",
+        action="store_true",
+        default=False,
+        help="Re-check required CLI tools even if a previous check passed",
+    )
+
     # Code path
     parser.add_argument(
         "--code-path",
@@ -7,8 +7,11 @@ Defines the interface that cloud providers (Azure, GCP) must implement.
 import logging
 import subprocess
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING
+from threading import Thread
+from typing import IO, TYPE_CHECKING
 
 from yocto.cloud.cloud_config import CloudProvider
 
@@ -17,6 +20,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Lines of stderr kept for the error report of a failed command
+STDERR_TAIL_LINES = 200
+
 
 class CloudApi(ABC):
     """Abstract base class for cloud provider APIs."""
@@ -31,25 +37,61 @@ class CloudApi(ABC):
     def run_command(
         cmd: list[str],
         show_logs: bool = False,
+        env: dict[str, str] | None = None,
     ) -> subprocess.CompletedProcess:
-        """Execute an Azure CLI command."""
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=not show_logs,
-                text=True,
-                check=True,
+        """Execute a CLI command.
+
+        stdout and stderr are drained line by line while the command runs,
+        so verbose commands cannot fill a pipe and stall. With `show_logs`
+        every line is forwarded to the logger as it arrives. stdout is
+        always returned; only the last STDERR_TAIL_LINES lines of stderr
+        are kept, for error reporting.
+        """
+        stdout_lines: list[str] = []
+        stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+        def drain(stream: IO[str], sink: list[str] | deque[str]) -> None:
+            for line in iter(stream.readline, ""):
+                if show_logs:
+                    logger.info(line.rstrip())
+                sink.append(line)
+
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+        ) as process:
+            threads = [
+                Thread(target=drain, args=(process.stdout, stdout_lines)),
+                Thread(target=drain, args=(process.stderr, stderr_tail)),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            returncode = process.wait()
+
+        stdout = "".join(stdout_lines)
+        stderr = "".join(stderr_tail)
+        if returncode != 0:
+            logger.info(f"Command failed: {' '.join(map(str, cmd))}")
+            logger.info(f"Error: {stderr}")
+            raise subprocess.CalledProcessError(
+                returncode, cmd, output=stdout, stderr=stderr
             )
-            return result
-        except subprocess.CalledProcessError as e:
-            logger.info(f"Command failed: {' '.join(cmd)}")
-            logger.info(f"Error: {e.stderr}")
-            raise
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
 
     @staticmethod
     @abstractmethod
-    def check_dependencies():
-        """Check if required tools are installed."""
+    def check_dependencies(force: bool = False):
+        """Check if required tools are installed.
+
+        Args:
+            force: Re-run the check even if a previous run was cached
+        """
         raise NotImplementedError
 
     @classmethod
@@ -117,6 +159,28 @@ class CloudApi(ABC):
         """Update DNS A record with new IP address."""
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def replace_dns_ips(
+        cls, config: "DeployConfigs", ip_addresses: list[str]
+    ) -> None:
+        """Set the DNS A record to exactly these IPs in a single update."""
+        raise NotImplementedError
+
+    @classmethod
+    def update_dns_ips(
+        cls,
+        config: "DeployConfigs",
+        adds: Sequence[str] = (),
+        removes: Sequence[str] = (),
+    ) -> None:
+        """Add and remove several DNS A record IPs with one record write."""
+        removed = set(removes)
+        existing = cls.get_existing_dns_ips(config)
+        ips = [ip for ip in existing if ip not in removed]
+        ips += [ip for ip in adds if ip not in ips]
+        cls.replace_dns_ips(config, ips)
+
     @classmethod
     @abstractmethod
     def disk_exists(cls, config: "DeployConfigs", image_path: Path) -> bool:
@@ -225,6 +289,15 @@ class CloudApi(ABC):
         """Attach a data disk to a VM."""
         raise NotImplementedError
 
+    @staticmethod
+    def render_user_data(config: "DeployConfigs") -> str:
+        """Render the user-data passed to the VM at boot."""
+        return (
+            f'CERTBOT_EMAIL="{config.email}"\n'
+            f'RECORD_NAME="{config.domain.record}"\n'
+            f'DOMAIN="{config.domain.name}"\n'
+        )
+
     @classmethod
     @abstractmethod
     def create_user_data_file(cls, config: "DeployConfigs") -> str:
@@ -3,6 +3,7 @@
 Cloud provider configuration and validation.
 """
 
+from collections.abc import Callable
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -52,6 +53,34 @@ __all__ = [
 ]
 
 
+_REGION_VALIDATORS: dict[CloudProvider, Callable[[str], None]] = {
+    CloudProvider.AZURE: validate_azure_region,
+    CloudProvider.GCP: validate_gcp_region,
+}
+
+_DEFAULT_REGIONS: dict[CloudProvider, str] = {
+    CloudProvider.AZURE: AZURE_DEFAULT_REGION,
+    CloudProvider.GCP: GCP_DEFAULT_ZONE,
+}
+
+_DEFAULT_RESOURCE_GROUPS: dict[CloudProvider, str] = {
+    CloudProvider.AZURE: AZURE_DEFAULT_RESOURCE_GROUP,
+    CloudProvider.GCP: GCP_DEFAULT_PROJECT,
+}
+
+_DEFAULT_VM_SIZES: dict[CloudProvider, str] = {
+    CloudProvider.AZURE: AZURE_DEFAULT_VM_SIZE,
+    CloudProvider.GCP: GCP_DEFAULT_VM_TYPE,
+}
+
+
+def _lookup[T](table: dict[CloudProvider, T], cloud: CloudProvider) -> T:
+    try:
+        return table[cloud]
+    except KeyError:
+        raise ValueError(f"Unknown cloud provider: {cloud}") from None
+
+
 def validate_region(cloud: CloudProvider, region: str) -> None:
     """Validate that the region is valid for the specified cloud provider.
 
@@ -62,12 +91,7 @@ def validate_region(cloud: CloudProvider, region: str) -> None:
     Raises:
         ValueError: If the region is not valid for the cloud provider
     """
-    if cloud == CloudProvider.AZURE:
-        validate_azure_region(region)
-    elif cloud == CloudProvider.GCP:
-        validate_gcp_region(region)
-    else:
-        raise ValueError(f"Unknown cloud provider: {cloud}")
+    _lookup(_REGION_VALIDATORS, cloud)(region)
 
 
 def get_default_region(cloud: CloudProvider) -> str:
@@ -79,12 +103,7 @@ def get_default_region(cloud: CloudProvider) -> str:
     Returns:
         The default region/zone for that provider
     """
-    if cloud == CloudProvider.AZURE:
-        return AZURE_DEFAULT_REGION
-    elif cloud == CloudProvider.GCP:
-        return GCP_DEFAULT_ZONE
-    else:
-        raise ValueError(f"Unknown cloud provider: {cloud}")
+    return _lookup(_DEFAULT_REGIONS, cloud)
 
 
 def get_default_resource_group(cloud: CloudProvider) -> str:
@@ -96,12 +115,7 @@ def get_default_resource_group(cloud: CloudProvider) -> str:
     Returns:
         The default resource group/project name
     """
-    if cloud == CloudProvider.AZURE:
-        return AZURE_DEFAULT_RESOURCE_GROUP
-    elif cloud == CloudProvider.GCP:
-        return GCP_DEFAULT_PROJECT
-    else:
-        raise ValueError(f"Unknown cloud provider: {cloud}")
+    return _lookup(_DEFAULT_RESOURCE_GROUPS, cloud)
 
 
 def get_default_vm_size(cloud: CloudProvider) -> str:
@@ -113,9 +127,4 @@ def get_default_vm_size(cloud: CloudProvider) -> str:
     Returns:
         The default VM size/machine type
     """
-    if cloud == CloudProvider.AZURE:
-        return AZURE_DEFAULT_VM_SIZE
-    elif cloud == CloudProvider.GCP:
-        return GCP_DEFAULT_VM_TYPE
-    else:
-        raise ValueError(f"Unknown cloud provider: {cloud}")
+    return _lookup(_DEFAULT_VM_SIZES, cloud)
@@ -6,10 +6,18 @@ This module is separate from cloud_config.py to avoid circular imports,
 since the API classes depend on config classes.
 """
 
-from yocto.cloud.azure.api import AzureApi
+import importlib
+
 from yocto.cloud.cloud_api import CloudApi
 from yocto.cloud.cloud_config import CloudProvider
-from yocto.cloud.gcp.api import GcpApi
+
+# Provider -> (module, class). Imported on first use, so a run only loads
+# the SDK stack of the cloud it actually targets.
+_CLOUD_API_PATHS: dict[CloudProvider, tuple[str, str]] = {
+    CloudProvider.AZURE: ("yocto.cloud.azure.api", "AzureApi"),
+    CloudProvider.GCP: ("yocto.cloud.gcp.api", "GcpApi"),
+}
+_CLOUD_APIS: dict[CloudProvider, type[CloudApi]] = {}
 
 
 def get_cloud_api(cloud: CloudProvider) -> type[CloudApi]:
@@ -21,9 +29,11 @@ def get_cloud_api(cloud: CloudProvider) -> type[CloudApi]:
     Returns:
         The CloudApi class for that provider
     """
-    if cloud == CloudProvider.AZURE:
-        return AzureApi
-    elif cloud == CloudProvider.GCP:
-        return GcpApi
-    else:
-        raise ValueError(f"Unknown cloud provider: {cloud}")
+    if cloud not in _CLOUD_APIS:
+        try:
+            module_name, class_name = _CLOUD_API_PATHS[cloud]
+        except KeyError:
+            raise ValueError(f"Unknown cloud provider: {cloud}") from None
+        module = importlib.import_module(module_name)
+        _CLOUD_APIS[cloud] = getattr(module, class_name)
+    return _CLOUD_APIS[cloud]
@@ -4,15 +4,17 @@ Unified cloud argument parser.
 """
 
 import argparse
+import logging
+import os
 
 from yocto.cloud.azure.defaults import (
     DEFAULT_CERTBOT_EMAIL,
     DEFAULT_DOMAIN_NAME,
     DEFAULT_DOMAIN_RESOURCE_GROUP,
 )
+from yocto.cloud.azure.defaults import VALID_REGIONS_STR as AZURE_REGIONS_STR
 from yocto.cloud.base_parser import create_base_parser
 from yocto.cloud.cloud_config import (
-    AZURE_REGIONS,
     GCP_ZONES,
     CloudProvider,
     get_default_region,
@@ -20,6 +22,8 @@ from yocto.cloud.cloud_config import (
     get_default_vm_size,
 )
 
+logger = logging.getLogger(__name__)
+
 # Re-export for backwards compatibility
 __all__ = [
     "create_cloud_parser",
@@ -28,6 +32,27 @@ __all__ = [
     "confirm",
 ]
 
+# Help texts only depend on module constants, so build them once
+_REGION_HELP = (
+    "Cloud region/zone. Defaults based on --cloud:\n"
+    f"  Azure: {get_default_region(CloudProvider.AZURE)} "
+    f"(valid: {AZURE_REGIONS_STR})\n"
+    f"  GCP: {get_default_region(CloudProvider.GCP)} "
+    f"(valid: {', '.join(sorted(GCP_ZONES)[:5])}...)"
+)
+_RESOURCE_GROUP_HELP = (
+    "Resource group (Azure) or project (GCP). "
+    "Defaults based on --cloud:\n"
+    f"  Azure: {get_default_resource_group(CloudProvider.AZURE)}\n"
+    f"  GCP: {get_default_resource_group(CloudProvider.GCP)}"
+)
+_VM_SIZE_HELP = (
+    "VM size (Azure) or machine type (GCP). "
+    "Defaults based on --cloud:\n"
+    f"  Azure: {get_default_vm_size(CloudProvider.AZURE)}\n"
+    f"  GCP: {get_default_vm_size(CloudProvider.GCP)}"
+)
+
 
 def create_cloud_parser(description: str) -> argparse.ArgumentParser:
     """Create unified argument parser that works across cloud providers.
@@ -57,37 +82,21 @@ def create_cloud_parser(description: str) -> argparse.ArgumentParser:
         "-r",
         "--region",
         type=str,
-        help=(
-            "Cloud region/zone. Defaults based on --cloud:\n"
-            f"  Azure: {get_default_region(CloudProvider.AZURE)} "
-            f"(valid: {', '.join(sorted(AZURE_REGIONS))})\n"
-            f"  GCP: {get_default_region(CloudProvider.GCP)} "
-            f"(valid: {', '.join(sorted(GCP_ZONES)[:5])}...)"
-        ),
+        help=_REGION_HELP,
     )
 
     # Resource group / Project (optional, defaults based on cloud)
     parser.add_argument(
         "--resource-group",
         type=str,
-        help=(
-            "Resource group (Azure) or project (GCP). "
-            "Defaults based on --cloud:\n"
-            f"  Azure: {get_default_resource_group(CloudProvider.AZURE)}\n"
-            f"  GCP: {get_default_resource_group(CloudProvider.GCP)}"
-        ),
+        help=_RESOURCE_GROUP_HELP,
     )
 
     # VM size / machine type (optional, defaults based on cloud)
     parser.add_argument(
         "--vm-size",
         type=str,
-        help=(
-            "VM size (Azure) or machine type (GCP). "
-            "Defaults based on --cloud:\n"
-            f"  Azure: {get_default_vm_size(CloudProvider.AZURE)}\n"
-            f"  GCP: {get_default_vm_size(CloudProvider.GCP)}"
-        ),
+        help=_VM_SIZE_HELP,
     )
 
     # Domain configuration
@@ -182,7 +191,12 @@ def confirm(what: str) -> bool:
 
     Returns:
         True if user confirms, raises ValueError otherwise
+
+    Set YOCTO_ASSUME_YES=1 to confirm without prompting (e.g. in CI).
     """
+    if os.environ.get("YOCTO_ASSUME_YES") == "1":
+        logger.info(f"YOCTO_ASSUME_YES set; will {what}")
+        return True
     inp = input(f"Are you sure you want to {what}? [y/N]\n")
     if not inp.strip().lower() == "y":
         raise ValueError(f"Aborting; will not {what}")
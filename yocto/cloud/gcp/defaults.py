@@ -32,11 +32,17 @@ DEFAULT_PROVISIONING_MODEL = "STANDARD"
 DEFAULT_DISK_TYPE = "pd-balanced"
 DEFAULT_DISK_SIZE_GB = 32
 
+# Parallel Cloud Storage upload of the image archive
+GCS_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024  # bytes per part
+GCS_UPLOAD_MAX_WORKERS = 8
+
 # Valid GCP zones
 VALID_ZONES = {
     "us-central1-a",
     "asia-northeast1-b",
 }
+# Sorted, comma-separated list for help and error messages
+VALID_ZONES_STR = ", ".join(sorted(VALID_ZONES))
 
 
 def validate_region(region: str) -> None:
@@ -11,7 +11,11 @@ from yocto.config.deployment_config import (
 )
 from yocto.config.domain_config import DomainConfig
 from yocto.config.mode import Mode
-from yocto.config.utils import get_disk_size, get_host_ip
+from yocto.config.utils import (
+    get_cached_host_ip,
+    get_disk_size,
+    get_host_ip,
+)
 from yocto.config.vm_config import VmConfigs
 
 __all__ = [
@@ -29,5 +33,6 @@ __all__ = [
     "get_genesis_vm_prefix",
     # Utilities
     "get_host_ip",
+    "get_cached_host_ip",
     "get_disk_size",
 ]
@@ -7,7 +7,7 @@ from typing import Any
 from yocto.image.git import GitConfigs
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BuildConfigs:
     git: GitConfigs
 
@@ -10,7 +10,7 @@ from yocto.config.mode import Mode
 from yocto.utils.parser import parse_args
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Configs:
     mode: Mode
     build: BuildConfigs | None
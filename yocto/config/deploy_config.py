@@ -10,7 +10,7 @@ from yocto.config.vm_config import VmConfigs
 from yocto.utils.artifact import expect_artifact
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeployConfigs:
     vm: VmConfigs
     domain: DomainConfig
@@ -16,7 +16,7 @@ from yocto.config.configs import Configs
 from yocto.config.deploy_config import DeployConfigs
 from yocto.config.domain_config import DomainConfig
 from yocto.config.mode import Mode
-from yocto.config.utils import get_host_ip
+from yocto.config.utils import get_cached_host_ip, get_host_ip
 from yocto.config.vm_config import VmConfigs
 from yocto.utils.artifact import expect_artifact
 
@@ -53,7 +53,7 @@ def get_domain_record_prefix(cloud: CloudProvider) -> str:
         raise ValueError(f"Unsupported cloud provider: {cloud}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeploymentConfig:
     """Configuration for VM deployment (cloud-agnostic)."""
 
@@ -73,6 +73,7 @@ class DeploymentConfig:
     resource_group: str
     nsg_name: str
     show_logs: bool
+    force_check_deps: bool = False
 
     def to_configs(self) -> Configs:
         return Configs(
@@ -119,11 +120,13 @@ class DeploymentConfig:
         vm_size = args.vm_size or get_default_vm_size(cloud)
 
         source_ip = args.source_ip
+        if source_ip is None and not args.refresh_source_ip:
+            source_ip = get_cached_host_ip()
         if source_ip is None:
             logger.warning(
                 "No --source-ip provided, so fetching IP from ipify.org..."
             )
-            source_ip = get_host_ip()
+            source_ip = get_host_ip(refresh=True)
             logger.info(f"Fetched public IP: {source_ip}")
 
         return {
@@ -141,6 +144,7 @@ class DeploymentConfig:
             "domain_name": args.domain_name,
             "certbot_email": args.certbot_email,
             "show_logs": args.logs,
+            "force_check_deps": args.force_check_deps,
         }
 
     @classmethod
@@ -4,7 +4,7 @@ import argparse
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainConfig:
     record: str
     resource_group: str
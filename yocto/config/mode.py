@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from yocto.utils.artifact import parse_artifact
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Mode:
     build: bool
     deploy: bool
@@ -1,17 +1,65 @@
 """Utility functions for configuration."""
 
-import subprocess
+import json
+import os
+import time
+import urllib.request
 from pathlib import Path
 
+# Public IP of this machine from the last lookup
+HOST_IP_CACHE_FILE = Path.home() / ".cache" / "yocto" / "host_ip.json"
+HOST_IP_CACHE_TTL = 15 * 60  # seconds
+# Set to skip the lookup entirely (e.g. in CI)
+HOST_IP_ENV = "YOCTO_SOURCE_IP"
+HOST_IP_URL = "https://ifconfig.me/ip"
 
-def get_host_ip() -> str:
-    """Get the host's public IP address."""
-    result = subprocess.run(
-        "curl -s ifconfig.me", shell=True, capture_output=True, text=True
+# Public IP fetched by this process; it doesn't change mid-run
+_host_ip: str | None = None
+
+
+def get_cached_host_ip() -> str | None:
+    """Return a known public IP without a network lookup, or None.
+
+    Checks $YOCTO_SOURCE_IP, then an IP fetched earlier in this process,
+    then the cache file (unless expired).
+    """
+    ip = os.environ.get(HOST_IP_ENV) or _host_ip
+    if ip:
+        return ip
+    try:
+        cached = json.loads(HOST_IP_CACHE_FILE.read_text())
+        if time.time() - cached["ts"] < HOST_IP_CACHE_TTL:
+            return cached["ip"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def get_host_ip(refresh: bool = False) -> str:
+    """Get the host's public IP address.
+
+    Lookups are cached for HOST_IP_CACHE_TTL seconds unless `refresh`
+    is set, in which case only an IP from this process is reused.
+    """
+    global _host_ip
+    cached_ip = (
+        os.environ.get(HOST_IP_ENV) or _host_ip
+        if refresh
+        else get_cached_host_ip()
     )
-    if result.returncode != 0:
-        raise RuntimeError("Failed to fetch host IP")
-    return result.stdout.strip()
+    if cached_ip:
+        return cached_ip
+
+    try:
+        with urllib.request.urlopen(HOST_IP_URL, timeout=10) as response:
+            ip = response.read().decode().strip()
+    except OSError as e:
+        raise RuntimeError("Failed to fetch host IP") from e
+    _host_ip = ip
+
+    HOST_IP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    HOST_IP_CACHE_FILE.write_text(json.dumps({"ip": ip, "ts": time.time()}))
+    return ip
 
 
 def get_disk_size(disk_path: str) -> int:
@@ -12,7 +12,7 @@ from yocto.cloud.cloud_config import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VmConfigs:
     resource_group: str
     name: str
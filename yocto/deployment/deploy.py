@@ -2,9 +2,11 @@ import glob
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from yocto.cloud.cloud_api import CloudApi
 from yocto.cloud.cloud_config import CloudProvider
 from yocto.cloud.cloud_factory import get_cloud_api
 from yocto.config import DeployConfigs
@@ -46,6 +48,31 @@ def delete_vm(vm_name: str, home: str) -> bool:
     return cloud_api.delete_vm(vm_name, resource_group, region, artifact, home)
 
 
+def _prepare_disk(
+    cloud_api: type[CloudApi],
+    configs: DeployConfigs,
+    image_path: Path,
+) -> str:
+    """Create (if needed) and upload the OS disk, returning its name."""
+    if cloud_api.disk_exists(configs, image_path):
+        logger.warning(
+            f"Disk for artifact {image_path.name} already exists for "
+            f"{configs.vm.name}, skipping creation"
+        )
+        # Get the disk name without creating it (for passing to create_vm)
+        disk_name = cloud_api.get_disk_name(configs, image_path)
+    else:
+        disk_name = cloud_api.create_disk(configs, image_path)
+    cloud_api.upload_disk(configs, image_path)
+    return disk_name
+
+
+def _prepare_nsg(cloud_api: type[CloudApi], configs: DeployConfigs) -> None:
+    """Create the security group and its standard rules."""
+    cloud_api.create_nsg(configs)
+    cloud_api.create_standard_nsg_rules(configs)
+
+
 def deploy_image(
     image_path: Path,
     configs: DeployConfigs,
@@ -61,21 +88,15 @@ def deploy_image(
     if not image_path.exists():
         raise FileNotFoundError(f"Image path not found: {image_path}")
 
-    # Disk
-    if cloud_api.disk_exists(configs, image_path):
-        logger.warning(
-            f"Disk for artifact {image_path.name} already exists for "
-            f"{configs.vm.name}, skipping creation"
+    # The disk and the security groups are independent of each other,
+    # so run them concurrently; both must finish before the VM is created
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        disk_future = executor.submit(
+            _prepare_disk, cloud_api, configs, image_path
         )
-        # Get the disk name without creating it (for passing to create_vm)
-        disk_name = cloud_api.get_disk_name(configs, image_path)
-    else:
-        disk_name = cloud_api.create_disk(configs, image_path)
-    cloud_api.upload_disk(configs, image_path)
-
-    # Security groups
-    cloud_api.create_nsg(configs)
-    cloud_api.create_standard_nsg_rules(configs)
+        nsg_future = executor.submit(_prepare_nsg, cloud_api, configs)
+        disk_name = disk_future.result()
+        nsg_future.result()
 
     # Actually create the VM
     cloud_api.create_vm(configs, image_path, ip_name, disk_name)
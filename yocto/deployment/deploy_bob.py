@@ -23,7 +23,12 @@ from yocto.cloud.azure.defaults import (
     DEFAULT_RESOURCE_GROUP,
     DEFAULT_VM_SIZE,
 )
-from yocto.config import DeployConfigs, DeploymentConfig, get_host_ip
+from yocto.config import (
+    DeployConfigs,
+    DeploymentConfig,
+    get_cached_host_ip,
+    get_host_ip,
+)
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -142,7 +147,7 @@ def deploy_bob_vm(
 
     # Step 1: Check dependencies
     logger.info("\n==> Step 1/9: Checking prerequisites...")
-    az_cli.check_dependencies()
+    az_cli.check_dependencies(force=config.force_check_deps)
 
     # Step 2: Create resource group
     logger.info("\n==> Step 2/9: Creating resource group...")
@@ -323,6 +328,13 @@ def parse_bob_args():
         help="Source IP address for SSH access (auto-detected if not provided)",
     )
 
+    parser.add_argument(
+        "--refresh-source-ip",
+        action="store_true",
+        help="Re-detect the source IP instead of using the cached one",
+        default=False,
+    )
+
     parser.add_argument(
         "-v",
         "--logs",
@@ -331,6 +343,13 @@ def parse_bob_args():
         default=False,
     )
 
+    parser.add_argument(
+        "--force-check-deps",
+        action="store_true",
+        help="Re-check az/azcopy even if a previous check passed",
+        default=False,
+    )
+
     return parser.parse_args()
 
 
@@ -349,9 +368,11 @@ def main():
 
     # Auto-detect source IP if not provided
     source_ip = args.source_ip
+    if not source_ip and not args.refresh_source_ip:
+        source_ip = get_cached_host_ip()
     if not source_ip:
         logger.warning("No --source-ip provided, fetching from ipify.org...")
-        source_ip = get_host_ip()
+        source_ip = get_host_ip(refresh=True)
         logger.info(f"Detected source IP: {source_ip}")
 
     try:
@@ -375,6 +396,7 @@ def main():
             certbot_email=DEFAULT_CERTBOT_EMAIL,
             nsg_name=args.name,
             show_logs=args.logs,
+            force_check_deps=args.force_check_deps,
         )
 
         ip_address = deploy_bob_vm(config, vhd_path, args.data_disk_size)
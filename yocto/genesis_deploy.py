@@ -74,7 +74,7 @@ def deploy_genesis_vm(args: DeploymentConfig) -> None:
     genesis_ip_manager = GenesisIPManager(cloud_api, args.resource_group)
 
     # Check dependencies
-    cloud_api.check_dependencies()
+    cloud_api.check_dependencies(force=args.force_check_deps)
 
     # Create resource group
     cloud_api.ensure_created_resource_group(
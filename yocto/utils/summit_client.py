@@ -14,14 +14,17 @@ Json = Any
 class SummitClient:
     def __init__(self, url: str):
         self.url = url
+        # Keep the connection alive across the health/key/share/genesis
+        # calls made against each node
+        self.session = requests.Session()
 
     def _get(self, path: str) -> str:
-        response = requests.get(f"{self.url}/{path}")
+        response = self.session.get(f"{self.url}/{path}")
         response.raise_for_status()
         return response.text
 
     def _post_text(self, path: str, body: str) -> str:
-        response = requests.post(
+        response = self.session.post(
             f"{self.url}/{path}",
             data=body,
             headers={"Content-Type": "text/plain"},